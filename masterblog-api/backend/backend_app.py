@@ -1,24 +1,76 @@
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+from flask import Flask, request
+from werkzeug.exceptions import NotFound
 from flask_swagger_ui import get_swaggerui_blueprint
 import datetime # Import datetime module for date handling
+import os # Environment flags
+import functools # Wrapping cached GET views
+import hashlib # ETags for cached responses
+from collections import OrderedDict, defaultdict # Posts keyed by ID, keeping insertion order
+import threading # Lock guarding the post ID counter
+from operator import itemgetter # C-level sort key
+import orjson # Fast JSON serializer with native datetime.date support
 
 # Initialize the Flask application
-app = Flask(__name__)
+# API-only backend: no static file route, no auto-generated OPTIONS routes
+# (preflights are answered by _answer_cors_preflight) and no trailing-slash redirects
+app = Flask(__name__, static_folder=None)
+app.config['PROVIDE_AUTOMATIC_OPTIONS'] = False
+app.url_map.strict_slashes = False
+
+# Allow cross-origin requests from any origin.
+# The policy is fixed, so a plain after_request hook sets the headers instead of Flask-CORS.
+_CORS_ALLOW_METHODS = 'GET, POST, PUT, DELETE, OPTIONS'
+
+@app.after_request
+def _add_cors_headers(response):
+    """Adds the CORS headers to every response, plus the preflight headers to OPTIONS responses."""
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    if request.method == 'OPTIONS':
+        response.headers['Access-Control-Allow-Methods'] = _CORS_ALLOW_METHODS
+        # Echo the requested headers, as Flask-CORS did by default
+        response.headers['Access-Control-Allow-Headers'] = request.headers.get('Access-Control-Request-Headers', 'Content-Type')
+    return response
+
+# Answer CORS preflight requests without adding URL rules
+@app.before_request
+def _answer_cors_preflight():
+    """
+    Returns an empty 204 response to OPTIONS requests for existing paths;
+    _add_cors_headers adds the preflight headers. Unknown paths still get a 404.
+    """
+    if request.method == 'OPTIONS' and not isinstance(request.routing_exception, NotFound):
+        return app.response_class(status=204)
 
-# Apply CORS to your app.
-CORS(app)
+# Helper to build a JSON response with orjson
+def _json(payload, status=200):
+    """
+    Serializes the payload with orjson and wraps it in a JSON response.
+    orjson encodes datetime.date objects as 'YYYY-MM-DD' natively.
+    """
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
 
-# Helper to convert a post (which might have datetime objects) to a JSON-serializable dict
-def serialize_post(post):
+# Helper to serialize a fixed JSON response once, at import time
+def _prebuilt_json(payload, status):
     """
-    Converts a post dictionary to a JSON-serializable format.
-    Ensures 'date' is formatted as 'YYYY-MM-DD' string.
+    Serializes a fixed payload once and returns a function building its response from the cached bytes.
+    A fresh response object is still built per request, because after_request hooks modify its headers.
     """
-    serialized = post.copy()
-    if 'date' in serialized and isinstance(serialized['date'], datetime.date):
-        serialized['date'] = serialized['date'].strftime('%Y-%m-%d')
-    return serialized
+    body = orjson.dumps(payload)
+    return lambda: app.response_class(body, status=status, mimetype='application/json')
+
+# Fixed error responses; errors that include request data are still built per request
+_ERR_SORT_FIELD = _prebuilt_json({"error": "Invalid sort field. 'sort' must be 'title', 'content', 'author', or 'date'."}, 400)
+_ERR_SORT_DIRECTION = _prebuilt_json({"error": "Invalid sort direction. 'direction' must be 'asc' or 'desc'."}, 400)
+_ERR_BODY_NOT_JSON = _prebuilt_json({"error": "Request body must be JSON."}, 400)
+_ERR_BODY_NOT_ARRAY = _prebuilt_json({"error": "Request body must be a non-empty JSON array of posts."}, 400)
+# Largest number of posts accepted by one bulk request
+_BULK_MAX_POSTS = 1000
+_ERR_BULK_TOO_LARGE = _prebuilt_json({"error": f"A bulk request may add at most {_BULK_MAX_POSTS} posts."}, 400)
+# Messages also returned by _parse_new_post, shared so both paths report the same text
+_INVALID_DATE_MESSAGE = "Invalid 'date' format. Use YYYY-MM-DD."
+_TEXT_FIELDS_MESSAGE = "'title', 'content' and 'author' must be strings."
+_ERR_INVALID_DATE = _prebuilt_json({"error": _INVALID_DATE_MESSAGE}, 400)
+_ERR_TEXT_FIELDS = _prebuilt_json({"error": _TEXT_FIELDS_MESSAGE}, 400)
 
 # Helper to parse date string to datetime.date object
 def parse_date_string(date_str):
@@ -27,29 +79,196 @@ def parse_date_string(date_str):
     Returns None if the format is invalid.
     """
     try:
+        # Fast path for the usual zero-padded 'YYYY-MM-DD'. fromisoformat alone would also accept
+        # forms like '20230607' or '2023-W23-3', so it only sees strings of exactly that shape.
+        if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+            try:
+                return datetime.date.fromisoformat(date_str)
+            except ValueError:
+                pass
+        # Anything else strptime accepts, such as '2023-6-7' or '2023-06- 7', stays valid
         return datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-    except ValueError:
+    except (ValueError, TypeError):
         return None
 
-# Hardcoded list of blog posts
+# Hardcoded blog posts, keyed by ID for constant-time lookup, update and delete
 # Updated to include 'author' and 'date' fields, with 'date' stored as datetime.date objects internally
-POSTS = [
+POSTS = OrderedDict((post['id'], post) for post in [
     {"id": 1, "title": "First Post", "content": "This is the first post.", "author": "John Doe", "date": datetime.date(2023, 6, 7)},
     {"id": 2, "title": "Second Post", "content": "This is the second post.", "author": "Jane Smith", "date": datetime.date(2023, 6, 8)},
     {"id": 3, "title": "Third Post", "content": "Another interesting post content.", "author": "John Doe", "date": datetime.date(2023, 6, 9)},
     {"id": 4, "title": "Fourth Post", "content": "Yet another piece of content for a blog.", "author": "Alice Brown", "date": datetime.date(2023, 6, 10)},
     {"id": 5, "title": "Fifth Post", "content": "Concluding thoughts on a topic.", "author": "Jane Smith", "date": datetime.date(2023, 6, 11)},
-]
+])
+
+# Lowercased, UTF-8 encoded search columns, keyed by post ID and refreshed whenever a post changes
+_titles_lc = {}
+_contents_lc = {}
+_authors_lc = {}
+# Formatted 'YYYY-MM-DD' date per post ID, computed once when the post is stored
+_dates_str = {}
+# Date index: formatted date string -> IDs of the posts published on that date
+_by_date = defaultdict(set)
+
+# Helper to lowercase and encode text for the search columns and queries
+def _encode_search_text(text):
+    """
+    Lowercases text and encodes it as UTF-8.
+    Lowercasing before encoding keeps non-ASCII letters case-insensitive,
+    and UTF-8 substring matches on bytes are the same as on the decoded text.
+    """
+    return text.lower().encode('utf-8')
+
+# Helper to refresh the search columns for a single post
+def _index_post(post):
+    """Stores the lowercased title, content, author and formatted date of a post."""
+    post_id = post['id']
+    _titles_lc[post_id] = _encode_search_text(post['title'])
+    _contents_lc[post_id] = _encode_search_text(post['content'])
+    _authors_lc[post_id] = _encode_search_text(post['author'])
+    date_str = post['date'].isoformat() # Same 'YYYY-MM-DD' output as strftime, without format parsing
+    old_date_str = _dates_str.get(post_id)
+    if old_date_str != date_str:
+        if old_date_str is not None:
+            _discard_from_date_index(old_date_str, post_id)
+        _by_date[date_str].add(post_id)
+        _dates_str[post_id] = date_str
+
+# Helper to drop a post from the search columns
+def _unindex_post(post_id):
+    """Removes a deleted post from the search columns."""
+    _titles_lc.pop(post_id, None)
+    _contents_lc.pop(post_id, None)
+    _authors_lc.pop(post_id, None)
+    old_date_str = _dates_str.pop(post_id, None)
+    if old_date_str is not None:
+        _discard_from_date_index(old_date_str, post_id)
+
+# Helper to remove a post ID from the date index
+def _discard_from_date_index(date_str, post_id):
+    """Removes a post ID from the date index, dropping dates with no posts left."""
+    post_ids = _by_date[date_str]
+    post_ids.discard(post_id)
+    if not post_ids:
+        del _by_date[date_str]
+
+for _post in POSTS.values():
+    _index_post(_post)
+
+# Next free post ID, computed once at startup and incremented on every insert
+_next_id = max(POSTS, default=0) + 1
+_next_id_lock = threading.Lock()
 
 # Helper function to generate a new unique ID for posts
-def get_next_id():
-    """Generates a new unique integer ID for a new blog post."""
-    if not POSTS:
-        return 1
-    return max(post['id'] for post in POSTS) + 1
+def get_next_id(count=1):
+    """
+    Generates a new unique integer ID for a new blog post.
+    With count > 1, reserves that many consecutive IDs and returns the first one.
+    """
+    global _next_id
+    with _next_id_lock:
+        new_id = _next_id
+        _next_id += count
+    return new_id
+
+# Helper to validate the JSON object of a new post
+def _parse_new_post(data):
+    """
+    Validates a new post's 'title', 'content', 'author' and 'date' fields.
+    Returns (post fields, None, None) with the date parsed to a datetime.date object.
+    If a field is missing, not a string, or the date format is invalid, returns
+    (None, error message, prebuilt error response); the prebuilt response is None
+    for the missing-fields error, whose message depends on the input.
+    """
+    title = data.get('title')
+    content = data.get('content')
+    author = data.get('author') # New required field
+    date_str = data.get('date') # New required field (string format)
+
+    # Only build the list of missing fields when the quick check fails
+    if not (title and content and author and date_str):
+        missing_fields = [name for name, value in (('title', title), ('content', content), ('author', author), ('date', date_str)) if not value]
+        return None, f"Missing required fields: {', '.join(missing_fields)}.", None
+
+    # The search columns lowercase these fields, so anything but a string is rejected
+    if not (isinstance(title, str) and isinstance(content, str) and isinstance(author, str)):
+        return None, _TEXT_FIELDS_MESSAGE, _ERR_TEXT_FIELDS
+
+    # Parse date string into datetime.date object
+    parsed_date = parse_date_string(date_str)
+    if not parsed_date:
+        return None, _INVALID_DATE_MESSAGE, _ERR_INVALID_DATE
+
+    return {"title": title, "content": content, "author": author, "date": parsed_date}, None, None
+
+# Allowed values for the 'sort' and 'direction' query parameters of get_posts
+_SORT_FIELDS = frozenset({'title', 'content', 'author', 'date'})
+_SORT_DIRECTIONS = frozenset({'asc', 'desc'})
+
+# Guards the response cache
+_cache_lock = threading.Lock()
+
+# Cached GET responses, least recently used first: (endpoint, normalized parameters) -> (JSON body, ETag)
+_response_cache = OrderedDict()
+# Upper bound on cached responses, matching Flask-Caching's SimpleCache default threshold
+_RESPONSE_CACHE_SIZE = 500
+# Bumped on every write, so a response built from older data is not cached
+_cache_generation = 0
+
+# Helper to drop the cached responses after POSTS changes
+def _invalidate_caches():
+    """Clears the cached GET responses; they are rebuilt on the next request."""
+    global _cache_generation
+    with _cache_lock:
+        _response_cache.clear()
+        _cache_generation += 1
+
+# Decorator factory caching successful GET responses until the next write
+def _cache_response(make_key):
+    """
+    Serves repeated GET requests with the same parameters from a cached JSON body.
+    make_key returns the view's normalized query parameters, so unrelated or reordered
+    parameters share one entry. At most _RESPONSE_CACHE_SIZE responses are kept,
+    evicting the least recently used one.
+    Responses carry an ETag, so clients sending If-None-Match get a 304 Not Modified.
+    Error responses are never cached.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (view.__name__, make_key())
+            with _cache_lock:
+                cached = _response_cache.get(key)
+                if cached is not None:
+                    _response_cache.move_to_end(key)
+                generation = _cache_generation
+            if cached is None:
+                response = view(*args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                body = response.get_data()
+                cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+                with _cache_lock:
+                    if generation == _cache_generation:
+                        _response_cache[key] = cached
+                        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                            _response_cache.popitem(last=False)
+            body, etag = cached
+            response = app.response_class(body, mimetype='application/json')
+            response.set_etag(etag)
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+# Helper to build the response cache key of get_posts
+def _list_cache_key():
+    """Returns the sort parameters; direction only matters when a sort field is given."""
+    sort_by = request.args.get('sort')
+    return (sort_by, request.args.get('direction')) if sort_by else None
 
 # Define the "List" endpoint
 @app.route('/posts', methods=['GET'])
+@_cache_response(_list_cache_key)
 def get_posts():
     """
     Returns a list of all blog posts, with optional sorting.
@@ -60,29 +279,22 @@ def get_posts():
     sort_by = request.args.get('sort')
     direction = request.args.get('direction')
 
-    current_posts = list(POSTS) # Create a copy to sort, keeping original POSTS list unchanged for default order
-
     if sort_by:
         # Validate sort_by field
-        if sort_by not in ['title', 'content', 'author', 'date']:
-            return jsonify({"error": "Invalid sort field. 'sort' must be 'title', 'content', 'author', or 'date'."}), 400
+        if sort_by not in _SORT_FIELDS:
+            return _ERR_SORT_FIELD()
 
         # Validate direction
-        if direction not in ['asc', 'desc']:
-            return jsonify({"error": "Invalid sort direction. 'direction' must be 'asc' or 'desc'."}), 400
-
-        reverse_sort = (direction == 'desc')
+        if direction not in _SORT_DIRECTIONS:
+            return _ERR_SORT_DIRECTION()
 
-        # Sort based on the specified field
-        if sort_by == 'date':
-            # Sort by actual date objects for chronological order
-            current_posts.sort(key=lambda post: post['date'], reverse=reverse_sort)
-        else:
-            # Sort by other fields (title, content, author)
-            current_posts.sort(key=lambda post: post[sort_by], reverse=reverse_sort)
+        # Only runs on a response cache miss; date objects sort chronologically, the text fields alphabetically
+        current_posts = sorted(POSTS.values(), key=itemgetter(sort_by), reverse=(direction == 'desc'))
+    else:
+        current_posts = list(POSTS.values()) # Keep POSTS in insertion order
 
-    # Serialize posts before jsonify to ensure date is in YYYY-MM-DD string format
-    return jsonify([serialize_post(post) for post in current_posts])
+    # orjson serializes the date objects to YYYY-MM-DD strings directly
+    return _json(current_posts)
 
 # Define the "Add" endpoint
 @app.route('/posts', methods=['POST'])
@@ -91,53 +303,78 @@ def add_post():
     Adds a new blog post to the list.
     Expects JSON input with 'title', 'content', 'author', and 'date'.
     Returns the new post with a generated ID and 201 Created status on success.
-    Returns 400 Bad Request if any required fields are missing or date format is invalid.
+    Returns 400 Bad Request if any required fields are missing, 'title', 'content' or 'author'
+    is not a string, or date format is invalid.
     """
-    data = request.json
-
-    if not data:
-        return jsonify({"error": "Request body must be JSON."}), 400
-
-    title = data.get('title')
-    content = data.get('content')
-    author = data.get('author') # New required field
-    date_str = data.get('date') # New required field (string format)
+    data = request.get_json(silent=True)
 
-    missing_fields = []
-    if not title:
-        missing_fields.append('title')
-    if not content:
-        missing_fields.append('content')
-    if not author:
-        missing_fields.append('author')
-    if not date_str:
-        missing_fields.append('date')
+    if not data or not isinstance(data, dict):
+        return _ERR_BODY_NOT_JSON()
 
-    if missing_fields:
-        return jsonify({"error": f"Missing required fields: {', '.join(missing_fields)}."}), 400
-
-    # Parse date string into datetime.date object
-    parsed_date = parse_date_string(date_str)
-    if not parsed_date:
-        return jsonify({"error": "Invalid 'date' format. Use YYYY-MM-DD."}), 400
+    fields, error, prebuilt_error = _parse_new_post(data)
+    if prebuilt_error:
+        return prebuilt_error()
+    if error:
+        return _json({"error": error}, 400)
 
     # Generate a unique ID for the new post
     new_id = get_next_id()
 
     # Create the new post dictionary, storing date as a datetime.date object
-    new_post = {
-        "id": new_id,
-        "title": title,
-        "content": content,
-        "author": author,
-        "date": parsed_date
-    }
+    new_post = {"id": new_id, **fields}
+
+    # Index the new post first, then add it to our hardcoded posts
+    _index_post(new_post)
+    POSTS[new_id] = new_post
+    _invalidate_caches()
 
-    # Add the new post to our hardcoded list
-    POSTS.append(new_post)
+    # Return the newly created post; orjson serializes the date to a string
+    return _json(new_post, 201)
 
-    # Return the newly created post, ensuring date is serialized to string
-    return jsonify(serialize_post(new_post)), 201
+# Define the "Bulk Add" endpoint
+@app.route('/posts/bulk', methods=['POST'])
+def add_posts_bulk():
+    """
+    Adds several blog posts in one request.
+    Expects a JSON array of objects, each with 'title', 'content', 'author', and 'date'.
+    Returns the new posts with generated IDs and 201 Created status on success.
+    Returns 400 Bad Request if the body is not JSON, not a non-empty JSON array, holds more than
+    _BULK_MAX_POSTS posts, or any post is invalid; in that case no posts are added.
+    """
+    # Like add_post, only accept bodies sent as JSON
+    if not request.is_json:
+        return _ERR_BODY_NOT_JSON()
+
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return _ERR_BODY_NOT_JSON()
+
+    if not data or not isinstance(data, list):
+        return _ERR_BODY_NOT_ARRAY()
+
+    if len(data) > _BULK_MAX_POSTS:
+        return _ERR_BULK_TOO_LARGE()
+
+    # Validate every post before adding any of them
+    all_fields = []
+    for index, item in enumerate(data):
+        if not isinstance(item, dict):
+            return _json({"error": f"Post at index {index}: must be a JSON object."}, 400)
+        fields, error, _ = _parse_new_post(item)
+        if error:
+            return _json({"error": f"Post at index {index}: {error}"}, 400)
+        all_fields.append(fields)
+
+    # Reserve all IDs at once, then add the posts and refresh the caches a single time
+    first_id = get_next_id(len(all_fields))
+    new_posts = [{"id": first_id + offset, **fields} for offset, fields in enumerate(all_fields)]
+    for new_post in new_posts:
+        _index_post(new_post)
+    POSTS.update((new_post['id'], new_post) for new_post in new_posts)
+    _invalidate_caches()
+
+    return _json(new_posts, 201)
 
 # Define the "Delete" endpoint
 @app.route('/posts/<int:post_id>', methods=['DELETE'])
@@ -147,15 +384,12 @@ def delete_post(post_id):
     Returns a success message with 200 OK status if found and deleted.
     Returns a 404 Not Found status if the post does not exist.
     """
-    global POSTS
-    original_len = len(POSTS)
-
-    POSTS = [post for post in POSTS if post['id'] != post_id]
+    if POSTS.pop(post_id, None) is None:
+        return _json({"error": f"Post with id {post_id} not found."}, 404)
+    _unindex_post(post_id)
+    _invalidate_caches()
 
-    if len(POSTS) < original_len:
-        return jsonify({"message": f"Post with id {post_id} has been deleted successfully."}), 200
-    else:
-        return jsonify({"error": f"Post with id {post_id} not found."}), 404
+    return _json({"message": f"Post with id {post_id} has been deleted successfully."}, 200)
 
 # Define the "Update" endpoint
 @app.route('/posts/<int:post_id>', methods=['PUT'])
@@ -165,19 +399,27 @@ def update_post(post_id):
     Expects JSON input with optional 'title', 'content', 'author', and 'date'.
     Returns the updated post with 200 OK status if found and updated.
     Returns 404 Not Found status if the post does not exist.
-    Returns 400 Bad Request if 'date' format is invalid.
+    Returns 400 Bad Request if the body is not a JSON object, 'title', 'content' or 'author'
+    is not a string, or 'date' format is invalid.
     """
-    global POSTS
-    data = request.json
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return _ERR_BODY_NOT_JSON()
 
-    post_found = None
-    for post in POSTS:
-        if post['id'] == post_id:
-            post_found = post
-            break
+    post_found = POSTS.get(post_id)
 
     if not post_found:
-        return jsonify({"error": f"Post with id {post_id} not found."}), 404
+        return _json({"error": f"Post with id {post_id} not found."}, 404)
+
+    # Validate everything first so a rejected update leaves the post untouched
+    if any(field in data and not isinstance(data[field], str) for field in ('title', 'content', 'author')):
+        return _ERR_TEXT_FIELDS()
+
+    if 'date' in data:
+        parsed_date = parse_date_string(data['date'])
+        if not parsed_date:
+            return _ERR_INVALID_DATE()
 
     # Update title if provided
     if 'title' in data:
@@ -191,62 +433,80 @@ def update_post(post_id):
     if 'author' in data:
         post_found['author'] = data['author']
 
-    # Update date if provided, including format validation
+    # Update date if provided
     if 'date' in data:
-        parsed_date = parse_date_string(data['date'])
-        if not parsed_date:
-            return jsonify({"error": "Invalid 'date' format. Use YYYY-MM-DD."}), 400
         post_found['date'] = parsed_date
 
-    # Return the updated post, ensuring date is serialized to string
-    return jsonify(serialize_post(post_found)), 200
+    # Refresh the search columns with the new values
+    _index_post(post_found)
+    _invalidate_caches()
+
+    # Return the updated post; orjson serializes the date to a string
+    return _json(post_found, 200)
+
+# Helper to build the response cache key of search_posts
+def _search_cache_key():
+    """Returns the lowercased search terms and the date, ignoring any other parameters."""
+    return (
+        request.args.get('title', '').lower(),
+        request.args.get('content', '').lower(),
+        request.args.get('author', '').lower(),
+        request.args.get('date', ''),
+    )
 
 # Define the "Search" endpoint
 @app.route('/posts/search', methods=['GET'])
+@_cache_response(_search_cache_key)
 def search_posts():
     """
     Searches for blog posts by title, content, author, or date based on query parameters.
     Returns a list of matching posts. Returns an empty list if no matches.
     """
-    search_title = request.args.get('title', '').lower()
-    search_content = request.args.get('content', '').lower()
-    search_author = request.args.get('author', '').lower() # New search parameter
+    search_title = _encode_search_text(request.args.get('title', ''))
+    search_content = _encode_search_text(request.args.get('content', ''))
+    search_author = _encode_search_text(request.args.get('author', '')) # New search parameter
     search_date_str = request.args.get('date', '') # New search parameter (string format)
 
-    results = []
-    for post in POSTS:
-        post_title_lower = post['title'].lower()
-        post_content_lower = post['content'].lower()
-        post_author_lower = post['author'].lower() # New field to search
-        post_date_str_formatted = post['date'].strftime('%Y-%m-%d') # Get string representation for comparison
-
-        title_matches = search_title and search_title in post_title_lower
-        content_matches = search_content and search_content in post_content_lower
-        author_matches = search_author and search_author in post_author_lower
-        # Exact match for date string
-        date_matches = search_date_str and search_date_str == post_date_str_formatted
-
-        if title_matches or content_matches or author_matches or date_matches:
-            results.append(post)
-
-    # Serialize results before jsonify
-    return jsonify([serialize_post(post) for post in results])
+    # Scan the precomputed lowercased columns instead of lowercasing every post
+    # A post matches if any queried field contains its term; one pass covers all fields
+    matching_ids = set()
+    if search_title or search_content or search_author:
+        for post_id, title_lc in _titles_lc.items():
+            if ((search_title and search_title in title_lc)
+                    or (search_content and search_content in _contents_lc[post_id])
+                    or (search_author and search_author in _authors_lc[post_id])):
+                matching_ids.add(post_id)
+    if search_date_str:
+        # Exact match for date string, looked up in the date index
+        matching_ids.update(_by_date.get(search_date_str, ()))
+
+    # IDs are handed out in increasing order, so sorting them keeps insertion order
+    results = [POSTS[post_id] for post_id in sorted(matching_ids)]
+
+    # orjson serializes the date objects to YYYY-MM-DD strings directly
+    return _json(results)
 
 # --- Swagger UI Configuration ---
+# Only registered when ENABLE_SWAGGER is set (e.g. ENABLE_SWAGGER=1 for development),
+# keeping the docs routes out of the production URL map.
 SWAGGER_URL = "/api/docs"
 API_URL = "/static/masterblog.json"
 
-swagger_ui_blueprint = get_swaggerui_blueprint(
-    SWAGGER_URL,
-    API_URL,
-    config={
-        'app_name': 'Masterblog API'
-    }
-)
-app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)
+if os.environ.get('ENABLE_SWAGGER'):
+    swagger_ui_blueprint = get_swaggerui_blueprint(
+        SWAGGER_URL,
+        API_URL,
+        config={
+            'app_name': 'Masterblog API'
+        }
+    )
+    app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)
 
 
 # This block ensures the Flask development server runs only when
 # the script is executed directly (not when imported as a module).
+# In production the app is served by gunicorn instead, see the Procfile.
+# It runs a single gevent worker: POSTS lives in process memory, so extra
+# worker processes would each see their own copy of the posts.
 if __name__ == '__main__':
-    app.run(debug=True, port=5002)
+    app.run(port=5002)
@@ -0,0 +1,192 @@
+import datetime
+import unittest
+
+import backend_app
+
+
+class BulkAddTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = backend_app.app.test_client()
+
+    def test_invalid_post_in_batch_adds_nothing(self):
+        """A batch with one invalid post is rejected as a whole."""
+        posts_before = self.client.get('/posts').get_json()
+        ids_before = list(backend_app.POSTS)
+
+        response = self.client.post('/posts/bulk', json=[
+            {"title": "Bulk One", "content": "Valid post.", "author": "Bulk Author", "date": "2024-01-01"},
+            {"title": "Bulk Two", "content": "Invalid author.", "author": ["x"], "date": "2024-01-02"},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(backend_app.POSTS), ids_before)
+        self.assertEqual(self.client.get('/posts').get_json(), posts_before)
+        self.assertEqual(self.client.get('/posts/search?author=bulk').get_json(), [])
+
+    def test_valid_batch_adds_all_posts(self):
+        """A valid batch adds every post with consecutive IDs."""
+        response = self.client.post('/posts/bulk', json=[
+            {"title": "Batch One", "content": "First of two.", "author": "Batch Author", "date": "2024-02-01"},
+            {"title": "Batch Two", "content": "Second of two.", "author": "Batch Author", "date": "2024-02-02"},
+        ])
+
+        self.assertEqual(response.status_code, 201)
+        new_ids = [post['id'] for post in response.get_json()]
+        self.assertEqual(new_ids[1], new_ids[0] + 1)
+        found_ids = [post['id'] for post in self.client.get('/posts/search?author=batch').get_json()]
+        self.assertEqual(found_ids, new_ids)
+
+    def test_oversized_batch_is_rejected(self):
+        """A batch over the size limit is rejected without adding any post."""
+        ids_before = list(backend_app.POSTS)
+        post = {"title": "Too Many", "content": "Content.", "author": "Author", "date": "2024-01-01"}
+
+        response = self.client.post('/posts/bulk', json=[post] * (backend_app._BULK_MAX_POSTS + 1))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(backend_app.POSTS), ids_before)
+
+    def test_non_json_content_type_is_rejected(self):
+        """Like POST /posts, the body must be sent as JSON."""
+        response = self.client.post('/posts/bulk', data='[]', content_type='text/plain')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Request body must be JSON."})
+
+
+class SearchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = backend_app.app.test_client()
+        response = self.client.post('/posts', json={
+            "title": "a\u001fzeta", "content": "Omega body.", "author": "Search Author", "date": "2024-03-01",
+        })
+        self.post_id = response.get_json()['id']
+
+    def tearDown(self):
+        self.client.delete(f'/posts/{self.post_id}')
+
+    def search_ids(self, query):
+        return [post['id'] for post in self.client.get(f'/posts/search?{query}').get_json()]
+
+    def test_multiple_fields_match_any(self):
+        """A post matches when any queried field contains its own term."""
+        self.assertIn(self.post_id, self.search_ids('title=zeta&author=nomatch'))
+        self.assertIn(self.post_id, self.search_ids('title=nomatch&content=OMEGA'))
+        self.assertIn(self.post_id, self.search_ids('content=nomatch&author=search'))
+
+    def test_terms_only_match_their_own_field(self):
+        """A term for one field never matches the text of another field."""
+        self.assertNotIn(self.post_id, self.search_ids('content=zeta&author=nomatch'))
+        self.assertNotIn(self.post_id, self.search_ids('title=omega&author=nomatch'))
+
+
+class ParseNewPostTestCase(unittest.TestCase):
+    def test_fixed_errors_return_their_prebuilt_response(self):
+        """Fixed validation errors come with the prebuilt response that add_post returns."""
+        valid = {"title": "Title", "content": "Content", "author": "Author", "date": "2024-01-01"}
+
+        _, _, prebuilt_error = backend_app._parse_new_post({**valid, "date": "not a date"})
+        self.assertIs(prebuilt_error, backend_app._ERR_INVALID_DATE)
+
+        _, _, prebuilt_error = backend_app._parse_new_post({**valid, "title": 123})
+        self.assertIs(prebuilt_error, backend_app._ERR_TEXT_FIELDS)
+
+    def test_missing_fields_error_is_built_per_request(self):
+        """The missing-fields error names the fields and has no prebuilt response."""
+        fields, error, prebuilt_error = backend_app._parse_new_post({"title": "Title"})
+
+        self.assertIsNone(fields)
+        self.assertEqual(error, "Missing required fields: content, author, date.")
+        self.assertIsNone(prebuilt_error)
+
+
+class ParseDateStringTestCase(unittest.TestCase):
+    def test_accepts_padded_and_unpadded_dates(self):
+        """Everything strptime('%Y-%m-%d') accepts stays valid, including unpadded or space-padded days."""
+        for value in ('2023-06-07', '2023-6-7', '2023-06- 7'):
+            self.assertEqual(backend_app.parse_date_string(value), datetime.date(2023, 6, 7))
+
+    def test_rejects_other_formats(self):
+        """Other ISO 8601 forms, impossible dates and non-strings are rejected."""
+        for value in ('20230607', '2023-W23-3', '2023-02-30', ' 2023-06-07', None, 20230607):
+            self.assertIsNone(backend_app.parse_date_string(value))
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = backend_app.app.test_client()
+
+    def test_unrelated_parameters_share_one_entry(self):
+        """Query parameters a view ignores do not create new cache entries."""
+        self.client.get('/posts')
+        size_before = len(backend_app._response_cache)
+
+        for i in range(20):
+            self.client.get(f'/posts?junk={i}')
+
+        self.assertEqual(len(backend_app._response_cache), size_before)
+
+    def test_cache_size_is_bounded(self):
+        """Distinct searches never grow the cache past its size limit."""
+        for i in range(backend_app._RESPONSE_CACHE_SIZE + 50):
+            self.client.get(f'/posts/search?title=term{i}')
+
+        self.assertEqual(len(backend_app._response_cache), backend_app._RESPONSE_CACHE_SIZE)
+
+    def test_matching_etag_gets_not_modified(self):
+        """A cached body is answered with 304 when If-None-Match carries its ETag."""
+        etag = self.client.get('/posts').headers['ETag']
+
+        response = self.client.get('/posts', headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+    def test_writes_invalidate_cached_bodies(self):
+        """POST, PUT and DELETE each replace the cached /posts and /posts/search bodies."""
+        search_url = '/posts/search?author=invalidation'
+
+        def titles(url):
+            return [post['title'] for post in self.client.get(url).get_json()]
+
+        self.assertNotIn('Cached One', titles('/posts'))
+        self.assertEqual(titles(search_url), [])
+        etag = self.client.get('/posts').headers['ETag']
+
+        response = self.client.post('/posts', json={
+            "title": "Cached One", "content": "Content.", "author": "Invalidation Author", "date": "2024-04-01",
+        })
+        post_id = response.get_json()['id']
+        self.assertIn('Cached One', titles('/posts'))
+        self.assertEqual(titles(search_url), ['Cached One'])
+        self.assertEqual(self.client.get('/posts', headers={'If-None-Match': etag}).status_code, 200)
+
+        self.client.put(f'/posts/{post_id}', json={"title": "Cached Two"})
+        self.assertIn('Cached Two', titles('/posts?sort=title&direction=asc'))
+        self.assertEqual(titles(search_url), ['Cached Two'])
+
+        self.client.delete(f'/posts/{post_id}')
+        self.assertNotIn('Cached Two', titles('/posts'))
+        self.assertEqual(titles(search_url), [])
+
+
+class CorsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = backend_app.app.test_client()
+
+    def test_preflight_for_existing_path(self):
+        """OPTIONS on an API path answers the preflight with 204 and the CORS headers."""
+        response = self.client.options('/posts', headers={'Access-Control-Request-Headers': 'content-type'})
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.headers['Access-Control-Allow-Origin'], '*')
+        self.assertEqual(response.headers['Access-Control-Allow-Headers'], 'content-type')
+
+    def test_unknown_path_is_not_found(self):
+        """Unknown paths get a 404 for every method, not a 405."""
+        for method in ('get', 'post', 'options'):
+            self.assertEqual(getattr(self.client, method)('/nope').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()